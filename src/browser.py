@@ -4,8 +4,12 @@ Uses Playwright with anti-detection measures.
 """
 
 import asyncio
+import logging
 import random
+import re
 import os
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 
@@ -19,9 +23,121 @@ except ImportError:
 
 from src.config import settings, USER_AGENTS, VIEWPORTS
 
+logger = logging.getLogger(__name__)
 
-def _system_chromium_candidates() -> list[str]:
-    """Return candidate system Chrome/Chromium binary paths."""
+# Module-local RNG with pre-bound methods for the per-action delay/scroll paths
+_RNG = random.Random()
+_uniform = _RNG.uniform
+_randint = _RNG.randint
+_choice = _RNG.choice
+
+# Images, fonts and map tiles are never read by the scraper.
+_BLOCK_RE = re.compile(
+    r"\.(png|jpg|jpeg|gif|svg|ico|webp|woff2?|ttf|otf)(\?|$)"
+    r"|maps\.googleapis\.com/maps/(api/js/GeoPhotoService|vt)"
+)
+
+# Additional anti-detection overrides, injected before any page script runs.
+_STEALTH_INIT_JS = """
+    // Remove webdriver property
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+    
+    // Fake plugins
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [
+            {
+                0: {type: "application/x-google-chrome-pdf", suffixes: "pdf", description: "Portable Document Format"},
+                description: "Portable Document Format",
+                filename: "internal-pdf-viewer",
+                length: 1,
+                name: "Chrome PDF Plugin"
+            },
+            {
+                0: {type: "application/pdf", suffixes: "pdf", description: "Portable Document Format"},
+                description: "Portable Document Format",
+                filename: "mhjfbmdgcfjbbpaeojofohoefgiehjai",
+                length: 1,
+                name: "Chrome PDF Viewer"
+            },
+            {
+                0: {type: "application/x-nacl", suffixes: "", description: "Native Client Executable"},
+                description: "Native Client Executable",
+                filename: "internal-nacl-plugin",
+                length: 1,
+                name: "Native Client"
+            }
+        ]
+    });
+    
+    // Fake languages
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-US', 'en', 'es']
+    });
+    
+    // Fake platform
+    Object.defineProperty(navigator, 'platform', {
+        get: () => 'Win32'
+    });
+    
+    // Fake hardware concurrency
+    Object.defineProperty(navigator, 'hardwareConcurrency', {
+        get: () => 8
+    });
+    
+    // Fake device memory
+    Object.defineProperty(navigator, 'deviceMemory', {
+        get: () => 8
+    });
+    
+    // Override permissions query
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+            Promise.resolve({ state: Notification.permission }) :
+            originalQuery(parameters)
+    );
+    
+    // Fake chrome runtime
+    window.chrome = {
+        runtime: {},
+        loadTimes: function() {},
+        csi: function() {},
+        app: {}
+    };
+"""
+
+
+# Same resources as _BLOCK_RE, as Chromium wildcard patterns for Network.setBlockedURLs.
+# Wildcards must match the whole URL, so each extension also gets a "?query" variant.
+_BLOCKED_EXTENSIONS = ("png", "jpg", "jpeg", "gif", "svg", "ico", "webp", "woff", "woff2", "ttf", "otf")
+_BLOCKED_URL_PATTERNS = [
+    *(f"*.{ext}" for ext in _BLOCKED_EXTENSIONS),
+    *(f"*.{ext}?*" for ext in _BLOCKED_EXTENSIONS),
+    "*maps.googleapis.com/maps/api/js/GeoPhotoService*",
+    "*maps.googleapis.com/maps/vt*",
+]
+
+
+async def _block_resources(route) -> None:
+    """Abort requests for resources matched by _BLOCK_RE, continue the rest."""
+    if _BLOCK_RE.search(route.request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _block_resources_cdp(context: BrowserContext, page: Page) -> None:
+    """Block resources natively in Chromium; no Python callback and the HTTP cache stays on."""
+    cdp = await context.new_cdp_session(page)
+    await cdp.send("Network.enable")
+    await cdp.send("Network.setBlockedURLs", {"urls": _BLOCKED_URL_PATTERNS})
+
+
+@lru_cache(maxsize=1)
+def _system_chromium_candidates() -> tuple[str, ...]:
+    """Return candidate system Chrome/Chromium binary paths (probed once per process)."""
     env_candidates = [
         os.getenv("PLAYWRIGHT_CHROMIUM_EXECUTABLE_PATH"),
         os.getenv("CHROME_BIN"),
@@ -36,14 +152,29 @@ def _system_chromium_candidates() -> list[str]:
         "/opt/google/chrome/chrome",
     ]
     candidates = [p for p in env_candidates + path_candidates if p]
-    return [p for p in candidates if Path(p).exists()]
+    return tuple(p for p in candidates if Path(p).exists())
+
+
+def _pinned_executable_path() -> str | None:
+    """Pick a system browser up front when the bundled browsers directory is missing."""
+    browsers_path = os.getenv("PLAYWRIGHT_BROWSERS_PATH")
+    # "0" means browsers live inside the playwright package itself
+    if not browsers_path or browsers_path == "0" or Path(browsers_path).exists():
+        return None
+    candidates = _system_chromium_candidates()
+    return candidates[0] if candidates else None
+
 
+# Probed once at import so slim containers skip the failing bundled launch
+_EXECUTABLE_PATH = _pinned_executable_path()
 
-async def _launch_with_fallback(playwright, headless: bool) -> Browser:
+
+async def _launch_with_fallback(playwright, headless: bool, extra_args: tuple = ()) -> Browser:
     """Launch bundled Chromium first, then fallback to a system executable."""
     launch_args = dict(
         headless=headless,
         args=[
+            *extra_args,
             "--disable-blink-features=AutomationControlled",
             "--no-sandbox",
             "--disable-setuid-sandbox",
@@ -55,6 +186,8 @@ async def _launch_with_fallback(playwright, headless: bool) -> Browser:
             "--lang=en-US",
         ],
     )
+    if _EXECUTABLE_PATH:
+        return await playwright.chromium.launch(**launch_args, executable_path=_EXECUTABLE_PATH)
     try:
         return await playwright.chromium.launch(**launch_args)
     except Exception as e:
@@ -63,7 +196,7 @@ async def _launch_with_fallback(playwright, headless: bool) -> Browser:
             raise
         for executable_path in _system_chromium_candidates():
             try:
-                print(f"Playwright fallback: trying system browser at {executable_path}")
+                logger.info("Playwright fallback: trying system browser at %s", executable_path)
                 return await playwright.chromium.launch(
                     **launch_args,
                     executable_path=executable_path,
@@ -73,26 +206,140 @@ async def _launch_with_fallback(playwright, headless: bool) -> Browser:
         raise
 
 
-async def create_stealth_browser(headless: bool = None, storage_state: str = None) -> tuple[Browser, BrowserContext, Page]:
+async def _connect_daemon(playwright, headless: bool) -> Browser | None:
     """
-    Create a stealth browser with anti-detection measures.
-    
-    Returns:
-        tuple: (browser, context, page)
+    Attach to a warm browser started by `main daemon`; None if none is listening.
+
+    The daemon keeps its own launch mode, so a mismatch with the requested
+    headless mode is reported rather than silently ignored.
     """
-    playwright = await async_playwright().start()
-    is_headless = headless if headless is not None else settings.HEADLESS
+    endpoint = f"http://localhost:{settings.DAEMON_PORT}"
     try:
-        browser = await _launch_with_fallback(playwright, is_headless)
+        browser = await playwright.chromium.connect_over_cdp(endpoint, timeout=2000)
     except Exception:
-        await playwright.stop()
-        raise
-    # Keep a handle so we can stop Playwright cleanly during shutdown.
-    setattr(browser, "_playwright_instance", playwright)
+        return None
+    logger.info("Connected to browser daemon at %s", endpoint)
+    try:
+        cdp = await browser.new_browser_cdp_session()
+        user_agent = (await cdp.send("Browser.getVersion"))["userAgent"]
+        await cdp.detach()
+    except Exception:
+        user_agent = None
+    if user_agent is not None and ("HeadlessChrome" in user_agent) != headless:
+        logger.warning(
+            "Browser daemon runs %s; requested %s mode is ignored (use --no-daemon to honour it)",
+            "headless" if "HeadlessChrome" in user_agent else "headed",
+            "headless" if headless else "headed",
+        )
+    return browser
+
+
+class _PlaywrightSingleton:
+    """Lazily started Playwright driver and Chromium shared by all contexts."""
+
+    def __init__(self):
+        self._playwright = None
+        self._browser: Browser | None = None
+        self._lock: asyncio.Lock | None = None
+        self._ctx_sem: asyncio.Semaphore | None = None
+        self._free_contexts: asyncio.Queue | None = None
+        self._listing_sem: asyncio.Semaphore | None = None
+        self.use_daemon = settings.USE_DAEMON
+
+    def context_pool(self) -> tuple[asyncio.Semaphore, asyncio.Queue]:
+        """Return the (semaphore, free-list) pair bounding pooled contexts."""
+        if self._ctx_sem is None:
+            self._ctx_sem = asyncio.Semaphore(settings.MAX_CONCURRENCY)
+            self._free_contexts = asyncio.Queue()
+        return self._ctx_sem, self._free_contexts
+
+    def listing_slots(self) -> asyncio.Semaphore:
+        """Return the semaphore bounding listing contexts across all scrapes."""
+        if self._listing_sem is None:
+            self._listing_sem = asyncio.Semaphore(max(1, settings.LISTING_CONCURRENCY))
+        return self._listing_sem
+
+    async def get_browser(self, headless: bool = None) -> Browser:
+        """
+        Return the shared browser, launching it on first use.
+
+        Args:
+            headless: Headless mode for the first launch (default from config)
+        """
+        if self._browser is not None:
+            return self._browser
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._browser is None:
+                is_headless = headless if headless is not None else settings.HEADLESS
+                playwright = await async_playwright().start()
+                try:
+                    # A running daemon skips the Chromium cold start entirely
+                    browser = await _connect_daemon(playwright, is_headless) if self.use_daemon else None
+                    self._browser = browser or await _launch_with_fallback(playwright, is_headless)
+                except Exception:
+                    await playwright.stop()
+                    raise
+                self._playwright = playwright
+        return self._browser
+
+    def owns(self, browser: Browser) -> bool:
+        """Return True if the given browser is the shared instance."""
+        return browser is not None and browser is self._browser
+
+    async def shutdown(self) -> None:
+        """Close the shared browser and stop the Playwright driver."""
+        browser, playwright = self._browser, self._playwright
+        self._browser = None
+        self._playwright = None
+        # Loop-bound primitives; asyncio.run() per command needs fresh ones.
+        # Pooled contexts are closed together with the browser.
+        self._lock = None
+        self._ctx_sem = None
+        self._free_contexts = None
+        self._listing_sem = None
+        try:
+            if browser is not None:
+                await browser.close()
+        finally:
+            if playwright is not None:
+                await playwright.stop()
+
+
+_PLAYWRIGHT = _PlaywrightSingleton()
+
+
+async def get_browser(headless: bool = None) -> Browser:
+    """Return the shared browser, launching it on first use."""
+    return await _PLAYWRIGHT.get_browser(headless)
+
+
+async def acquire_context(
+    headless: bool = None,
+    storage_state: str = None,
+    disable_routing: bool = False,
+) -> tuple[BrowserContext, Page]:
+    """
+    Open a fresh stealth context and page on the shared browser.
+
+    Only the context is created per call; the Chromium process is reused.
+
+    Args:
+        headless: Headless mode for the first browser launch
+        storage_state: Optional storage state file for the context
+        disable_routing: Skip page.route() blocking when ROUTE_BLOCKING is on.
+            page.route() disables the HTTP cache, so fast follow-up scrapes
+            may prefer cached assets.
+
+    Returns:
+        tuple: (context, page)
+    """
+    browser = await get_browser(headless)
     
     # Random viewport and user-agent
-    viewport = random.choice(VIEWPORTS)
-    user_agent = random.choice(USER_AGENTS)
+    viewport = _choice(VIEWPORTS)
+    user_agent = _choice(USER_AGENTS)
     
     # Create context with realistic settings
     context = await browser.new_context(
@@ -107,93 +354,171 @@ async def create_stealth_browser(headless: bool = None, storage_state: str = Non
         storage_state=storage_state
     )
     
-    # Create page
+    # Anti-detection scripts are registered on the context once and applied to
+    # every page it opens. The new stealth API accepts a context; the old one is per page.
+    await context.add_init_script(_STEALTH_INIT_JS)
+    if USE_NEW_API:
+        stealth = Stealth()
+        await stealth.apply_stealth_async(context)
+        setattr(context, "_stealthed", True)
+    
+    page = await new_stealth_page(context, disable_routing)
+    
+    return context, page
+
+
+async def new_stealth_page(context: BrowserContext, disable_routing: bool = False) -> Page:
+    """
+    Open a page in a context from acquire_context, with resource blocking.
+    
+    With the new playwright-stealth API, stealth is applied once per context.
+    The legacy 1.x API registers its evasions on a single page, so it runs
+    for every page the context opens.
+    
+    Args:
+        context: Playwright browser context
+        disable_routing: Skip page.route() blocking (see acquire_context)
+    """
     page = await context.new_page()
+    if not USE_NEW_API:
+        await stealth_async(page)
+    elif not getattr(context, "_stealthed", False):
+        # Contexts not created by acquire_context get stealth on their first page
+        await Stealth().apply_stealth_async(page)
+        setattr(context, "_stealthed", True)
     
-    # Block unnecessary resources for faster loading
+    # Block unnecessary resources for faster loading. CDP blocking happens inside
+    # Chromium; page.route() is kept behind ROUTE_BLOCKING since it disables the HTTP cache.
     if settings.BLOCK_IMAGES:
-        await page.route("**/*.{png,jpg,jpeg,gif,svg,ico,webp,woff,woff2,ttf,otf}", lambda route: route.abort())
-        await page.route("**/maps.googleapis.com/maps/api/js/GeoPhotoService*", lambda route: route.abort())
-        await page.route("**/maps.googleapis.com/maps/vt*", lambda route: route.abort())
+        if not settings.ROUTE_BLOCKING:
+            await _block_resources_cdp(context, page)
+        elif not disable_routing:
+            await page.route("**/*", _block_resources)
     
-    # Apply playwright-stealth (support both old and new API)
-    if USE_NEW_API:
-        stealth = Stealth()
-        await stealth.apply_stealth_async(page)
-    else:
-        await stealth_async(page)
+    return page
+
+
+async def release_context(context: BrowserContext) -> None:
+    """
+    Close a context obtained from acquire_context, keeping the browser alive.
     
-    # Add additional anti-detection scripts
-    await page.add_init_script("""
-        // Remove webdriver property
-        Object.defineProperty(navigator, 'webdriver', {
-            get: () => undefined
-        });
-        
-        // Fake plugins
-        Object.defineProperty(navigator, 'plugins', {
-            get: () => [
-                {
-                    0: {type: "application/x-google-chrome-pdf", suffixes: "pdf", description: "Portable Document Format"},
-                    description: "Portable Document Format",
-                    filename: "internal-pdf-viewer",
-                    length: 1,
-                    name: "Chrome PDF Plugin"
-                },
-                {
-                    0: {type: "application/pdf", suffixes: "pdf", description: "Portable Document Format"},
-                    description: "Portable Document Format",
-                    filename: "mhjfbmdgcfjbbpaeojofohoefgiehjai",
-                    length: 1,
-                    name: "Chrome PDF Viewer"
-                },
-                {
-                    0: {type: "application/x-nacl", suffixes: "", description: "Native Client Executable"},
-                    description: "Native Client Executable",
-                    filename: "internal-nacl-plugin",
-                    length: 1,
-                    name: "Native Client"
-                }
-            ]
-        });
-        
-        // Fake languages
-        Object.defineProperty(navigator, 'languages', {
-            get: () => ['en-US', 'en', 'es']
-        });
-        
-        // Fake platform
-        Object.defineProperty(navigator, 'platform', {
-            get: () => 'Win32'
-        });
-        
-        // Fake hardware concurrency
-        Object.defineProperty(navigator, 'hardwareConcurrency', {
-            get: () => 8
-        });
-        
-        // Fake device memory
-        Object.defineProperty(navigator, 'deviceMemory', {
-            get: () => 8
-        });
-        
-        // Override permissions query
-        const originalQuery = window.navigator.permissions.query;
-        window.navigator.permissions.query = (parameters) => (
-            parameters.name === 'notifications' ?
-                Promise.resolve({ state: Notification.permission }) :
-                originalQuery(parameters)
-        );
-        
-        // Fake chrome runtime
-        window.chrome = {
-            runtime: {},
-            loadTimes: function() {},
-            csi: function() {},
-            app: {}
-        };
-    """)
+    Args:
+        context: Playwright browser context
+    """
+    try:
+        await context.close()
+    except Exception as e:
+        logger.warning("Error closing context: %s", e)
+
+
+async def acquire_listing_context(wait: bool = True) -> tuple[BrowserContext, Page] | None:
+    """
+    Open a stealth context for listing scrapes under the browser-wide LISTING_CONCURRENCY bound.
+
+    Args:
+        wait: Block until a slot frees up; with False, return None when none is free
+
+    Returns:
+        tuple: (context, page), or None (only when wait is False)
+    """
+    sem = _PLAYWRIGHT.listing_slots()
+    if not wait and sem.locked():
+        return None
+    await sem.acquire()
+    try:
+        return await acquire_context()
+    except BaseException:
+        sem.release()
+        raise
+
+
+async def release_listing_context(context: BrowserContext) -> None:
+    """Close a context from acquire_listing_context and free its slot."""
+    sem = _PLAYWRIGHT.listing_slots()
+    try:
+        await release_context(context)
+    finally:
+        sem.release()
+
+
+@asynccontextmanager
+async def scoped_context(headless: bool = None):
+    """
+    Borrow a pooled (context, page) pair, bounded by MAX_CONCURRENCY.
+
+    Contexts are created on demand, at most MAX_CONCURRENCY of them, and
+    returned to the free list on exit. A context whose task raised is closed
+    rather than reused.
+
+    Yields:
+        tuple: (context, page)
+    """
+    sem, free = _PLAYWRIGHT.context_pool()
+    async with sem:
+        try:
+            context, page = free.get_nowait()
+        except asyncio.QueueEmpty:
+            context, page = await acquire_context(headless)
+        try:
+            yield context, page
+        except BaseException:
+            await release_context(context)
+            raise
+        else:
+            free.put_nowait((context, page))
+
+
+async def shutdown() -> None:
+    """Close the shared browser and stop Playwright (call once at process exit)."""
+    await _PLAYWRIGHT.shutdown()
+
+
+def set_daemon_enabled(enabled: bool) -> None:
+    """Toggle connecting to the browser daemon before launching Chromium."""
+    _PLAYWRIGHT.use_daemon = enabled
+
+
+async def serve_daemon(port: int = None, headless: bool = True) -> None:
+    """
+    Keep a Chromium instance alive with its DevTools endpoint on localhost.
+
+    Later CLI runs attach to it through connect_over_cdp() instead of
+    launching their own browser. Returns when the browser exits.
+
+    Args:
+        port: Remote debugging port (default from config)
+        headless: Run the daemon browser headless
+    """
+    port = port or settings.DAEMON_PORT
+    async with async_playwright() as playwright:
+        browser = await _launch_with_fallback(
+            playwright, headless, extra_args=(f"--remote-debugging-port={port}",)
+        )
+        closed = asyncio.Event()
+        browser.on("disconnected", lambda _: closed.set())
+        try:
+            await closed.wait()
+        finally:
+            if browser.is_connected():
+                await browser.close()
+
+
+async def create_stealth_browser(
+    headless: bool = None,
+    storage_state: str = None,
+    disable_routing: bool = False,
+) -> tuple[Browser, BrowserContext, Page]:
+    """
+    Create a stealth browser with anti-detection measures.
+    
+    The browser is the shared instance from get_browser(); only the
+    context and page are new.
     
+    Returns:
+        tuple: (browser, context, page)
+    """
+    browser = await get_browser(headless)
+    context, page = await acquire_context(headless, storage_state, disable_routing)
     return browser, context, page
 
 
@@ -208,7 +533,7 @@ async def human_delay(min_sec: float = None, max_sec: float = None) -> None:
     min_sec = min_sec if min_sec is not None else settings.MIN_DELAY
     max_sec = max_sec if max_sec is not None else settings.MAX_DELAY
     
-    delay = random.uniform(min_sec, max_sec)
+    delay = _uniform(min_sec, max_sec)
     await asyncio.sleep(delay)
 
 
@@ -219,7 +544,7 @@ async def random_scroll(page: Page) -> None:
     Args:
         page: Playwright page object
     """
-    scroll_amount = random.randint(300, 700)
+    scroll_amount = _randint(300, 700)
     
     await page.evaluate(f"window.scrollBy(0, {scroll_amount})")
     await human_delay(0.5, 1.5)
@@ -233,12 +558,12 @@ async def close_browser(browser: Browser) -> None:
         browser: Playwright browser object
     """
     try:
-        await browser.close()
-        playwright = getattr(browser, "_playwright_instance", None)
-        if playwright is not None:
-            await playwright.stop()
+        if _PLAYWRIGHT.owns(browser):
+            await _PLAYWRIGHT.shutdown()
+        else:
+            await browser.close()
     except Exception as e:
-        print(f"Warning: Error closing browser: {e}")
+        logger.warning("Error closing browser: %s", e)
 
 
 if __name__ == "__main__":
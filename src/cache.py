@@ -0,0 +1,62 @@
+"""
+Persistent manifest of completed bulk queries.
+Lets re-runs of a queries file skip (query, location) pairs already scraped today.
+"""
+
+import hashlib
+import os
+from datetime import date
+from pathlib import Path
+
+import orjson
+
+from src.config import settings
+
+
+class CacheManifest:
+    """JSON manifest mapping a query key to its result count and exported files."""
+
+    def __init__(self, cache_dir: str = None):
+        self.path = Path(cache_dir or settings.CACHE_DIR) / "bulk_manifest.json"
+        self._entries = self._load()
+
+    def _load(self) -> dict:
+        try:
+            return orjson.loads(self.path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+
+    @staticmethod
+    def key(
+        query: str,
+        location: str,
+        limit: int,
+        no_website: bool,
+        detail: bool,
+        output: str,
+        day: date = None,
+    ) -> str:
+        """Hash of the query, its scrape options, the output format and the day it ran."""
+        day = day or date.today()
+        raw = (
+            f"{query.strip().lower()}|{location.strip().lower()}|{limit}|{no_website}|{detail}"
+            f"|{output.strip().lower()}|{day.isoformat()}"
+        )
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        """Return the cached entry if every exported file still exists."""
+        entry = self._entries.get(key)
+        if not entry:
+            return None
+        if not all(Path(p).exists() for p in entry["files"].values() if p):
+            return None
+        return entry
+
+    def put(self, key: str, count: int, files: dict) -> None:
+        """Record a finished query and rewrite the manifest atomically."""
+        self._entries[key] = {"count": count, "files": files}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_bytes(orjson.dumps(self._entries, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, self.path)
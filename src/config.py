@@ -3,6 +3,8 @@ Configuration settings for Google Maps Business Scraper.
 """
 
 import os
+import sys
+from dataclasses import dataclass
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -10,21 +12,28 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+@dataclass(frozen=True, slots=True)
 class Settings:
-    """Application settings loaded from environment variables."""
+    """Application settings loaded once from environment variables."""
     
     OUTPUT_DIR: str = os.getenv("OUTPUT_DIR", "data/results")
+    CACHE_DIR: str = os.getenv("CACHE_DIR", "data/cache")
     DEFAULT_LIMIT: int = int(os.getenv("DEFAULT_LIMIT", "50"))
     MIN_DELAY: float = float(os.getenv("MIN_DELAY", "0.5"))
     MAX_DELAY: float = float(os.getenv("MAX_DELAY", "1.5"))
     HEADLESS: bool = os.getenv("HEADLESS", "False").lower() == "true"
     FAST_MODE: bool = os.getenv("FAST_MODE", "True").lower() == "true"
     BLOCK_IMAGES: bool = os.getenv("BLOCK_IMAGES", "True").lower() == "true"
+    MAX_CONCURRENCY: int = int(os.getenv("MAX_CONCURRENCY", "4"))
+    LISTING_CONCURRENCY: int = int(os.getenv("LISTING_CONCURRENCY", "4"))
+    ROUTE_BLOCKING: bool = os.getenv("ROUTE_BLOCKING", "False").lower() == "true"
+    LISTING_CACHE_TTL: int = int(os.getenv("LISTING_CACHE_TTL", "3600"))
+    USE_DAEMON: bool = os.getenv("USE_DAEMON", "False").lower() == "true"
+    DAEMON_PORT: int = int(os.getenv("DAEMON_PORT", "9333"))
     
-    @classmethod
-    def ensure_output_dir(cls) -> Path:
+    def ensure_output_dir(self) -> Path:
         """Ensure the output directory exists and return its path."""
-        output_path = Path(cls.OUTPUT_DIR)
+        output_path = Path(self.OUTPUT_DIR)
         output_path.mkdir(parents=True, exist_ok=True)
         return output_path
 
@@ -60,3 +69,7 @@ VIEWPORTS = [
 
 # Create settings instance for easy import
 settings = Settings()
+
+# Piped/redirected stdout carries only JSON-line summaries; every module's
+# Rich console writes status output to stderr in that case
+JSON_LINES = not sys.stdout.isatty()
@@ -3,72 +3,191 @@ Data export functionality for Google Maps Scraper.
 Supports CSV, JSON, and Excel formats.
 """
 
-import pandas as pd
-import json
+import csv
+import logging
+import orjson
+import xlsxwriter
 import os
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from src.config import Settings
+from functools import lru_cache
+from src.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+# Spaces become underscores, commas are dropped
+_FILENAME_TRANS = str.maketrans({" ": "_", ",": None})
+
+
+# Paths handed out by _generate_filename in this process. Concurrent queries can
+# share a slug and start in the same second; they must not write the same file.
+_ISSUED_PATHS = set()
+_ISSUED_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=128)
+def _slug(query: str, location: str) -> tuple:
+    """Filename-safe (query, location) pair, truncated to 20 chars each"""
+    return (
+        query.translate(_FILENAME_TRANS).lower()[:20],
+        location.translate(_FILENAME_TRANS).lower()[:20],
+    )
+
+
+def _fieldnames(data: list) -> list:
+    """Column names across all rows, in first-seen order"""
+    return list(dict.fromkeys(key for row in data for key in row))
+
+
+class CsvSink:
+    """
+    Incremental CSV writer for streamed scrapes.
+    
+    Rows are buffered and written every `batch_size` rows, then flushed, so
+    memory stays bounded and a crash keeps what was already scraped. The
+    file is created on the first flush; column order comes from that batch.
+    """
+    
+    def __init__(self, filepath: str, batch_size: int = 64):
+        self.filepath = filepath
+        self.batch_size = batch_size
+        self.count = 0
+        self._buffer = []
+        self._file = None
+        self._writer = None
+    
+    def write(self, row: dict) -> None:
+        self._buffer.append(row)
+        self.count += 1
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+    
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        if self._writer is None:
+            self._file = open(self.filepath, 'w', buffering=64 * 1024, newline='', encoding='utf-8-sig')
+            self._writer = csv.DictWriter(self._file, fieldnames=_fieldnames(self._buffer), extrasaction='ignore')
+            self._writer.writeheader()
+        self._writer.writerows(self._buffer)
+        self._buffer.clear()
+        self._file.flush()
+    
+    def close(self) -> str:
+        """Flush remaining rows and return the file path (None if nothing was written)."""
+        self.flush()
+        if self._file is None:
+            logger.warning("No data to export")
+            return None
+        self._file.close()
+        logger.info("💾 Saved CSV: %s", self.filepath)
+        return self.filepath
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
 
 
 class Exporter:
     def __init__(self, output_dir: str = None):
-        self.output_dir = output_dir or Settings.OUTPUT_DIR
+        self.output_dir = output_dir or settings.OUTPUT_DIR
         os.makedirs(self.output_dir, exist_ok=True)
     
     def _generate_filename(self, query: str, location: str, extension: str) -> str:
-        """Generate filename with timestamp"""
+        """Generate a unique filename with timestamp (a _2, _3... suffix on collisions)"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        # Clean query and location for filename
-        clean_query = query.replace(" ", "_").lower()[:20]
-        clean_location = location.replace(" ", "_").replace(",", "").lower()[:20]
-        return os.path.join(
-            self.output_dir,
-            f"{clean_query}_{clean_location}_{timestamp}.{extension}"
-        )
+        clean_query, clean_location = _slug(query, location)
+        stem = os.path.join(self.output_dir, f"{clean_query}_{clean_location}_{timestamp}")
+        with _ISSUED_LOCK:
+            filepath = f"{stem}.{extension}"
+            n = 1
+            while filepath in _ISSUED_PATHS or os.path.exists(filepath):
+                n += 1
+                filepath = f"{stem}_{n}.{extension}"
+            _ISSUED_PATHS.add(filepath)
+        return filepath
     
     def to_csv(self, data: list, query: str, location: str) -> str:
         """Export to CSV file"""
         if not data:
-            print("No data to export")
+            logger.warning("No data to export")
             return None
         
-        df = pd.DataFrame(data)
         filepath = self._generate_filename(query, location, "csv")
-        df.to_csv(filepath, index=False, encoding='utf-8-sig')
-        print(f"💾 Saved CSV: {filepath}")
+        with open(filepath, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.DictWriter(f, fieldnames=_fieldnames(data))
+            writer.writeheader()
+            writer.writerows(data)
+        logger.info("💾 Saved CSV: %s", filepath)
         return filepath
     
+    def open_csv_sink(self, query: str, location: str, batch_size: int = 64) -> CsvSink:
+        """Open a streaming CSV sink for rows produced while scraping"""
+        return CsvSink(self._generate_filename(query, location, "csv"), batch_size)
+    
     def to_json(self, data: list, query: str, location: str) -> str:
         """Export to JSON file"""
         if not data:
-            print("No data to export")
+            logger.warning("No data to export")
             return None
         
         filepath = self._generate_filename(query, location, "json")
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        print(f"💾 Saved JSON: {filepath}")
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        logger.info("💾 Saved JSON: %s", filepath)
         return filepath
     
     def to_excel(self, data: list, query: str, location: str) -> str:
         """Export to Excel file"""
         if not data:
-            print("No data to export")
+            logger.warning("No data to export")
             return None
         
-        df = pd.DataFrame(data)
+        fieldnames = _fieldnames(data)
         filepath = self._generate_filename(query, location, "xlsx")
-        df.to_excel(filepath, index=False, engine='openpyxl')
-        print(f"💾 Saved Excel: {filepath}")
+        # constant_memory streams rows to disk instead of holding the workbook in RAM
+        workbook = xlsxwriter.Workbook(filepath, {'constant_memory': True})
+        try:
+            worksheet = workbook.add_worksheet()
+            header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+            worksheet.write_row(0, 0, fieldnames, header_format)
+            for row_num, row in enumerate(data, 1):
+                worksheet.write_row(row_num, 0, [row.get(key) for key in fieldnames])
+        finally:
+            workbook.close()
+        logger.info("💾 Saved Excel: %s", filepath)
         return filepath
     
-    def export_all(self, data: list, query: str, location: str) -> dict:
-        """Export to all formats"""
+    def _writers(self) -> dict:
         return {
-            'csv': self.to_csv(data, query, location),
-            'json': self.to_json(data, query, location),
-            'excel': self.to_excel(data, query, location)
+            'csv': self.to_csv,
+            'json': self.to_json,
+            'excel': self.to_excel,
         }
+    
+    def export_all(self, data: list, query: str, location: str) -> dict:
+        """Export to all formats (written concurrently, each to its own file)"""
+        writers = self._writers()
+        with ThreadPoolExecutor(max_workers=len(writers)) as pool:
+            futures = {
+                fmt: pool.submit(writer, data, query, location)
+                for fmt, writer in writers.items()
+            }
+            return {fmt: future.result() for fmt, future in futures.items()}
+    
+    async def export_all_async(self, data: list, query: str, location: str) -> dict:
+        """Export to all formats without blocking the event loop"""
+        writers = self._writers()
+        paths = await asyncio.gather(*(
+            asyncio.to_thread(writer, data, query, location)
+            for writer in writers.values()
+        ))
+        return dict(zip(writers, paths))
 
 
 # Test
@@ -78,5 +197,6 @@ if __name__ == "__main__":
         {"name": "Another Place", "rating": 4.2, "address": "456 Oak Ave", "phone": "+1 555-5678"},
     ]
     
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     exporter = Exporter()
     exporter.export_all(test_data, "coffee shops", "Manhattan")
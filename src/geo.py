@@ -2,25 +2,85 @@
 Geographic utility to fetch real neighborhoods/districts from OpenStreetMap (Overpass API).
 """
 
+import asyncio
+import hashlib
+import time
+from pathlib import Path
 import httpx
+import orjson
 from rich.console import Console
 
-console = Console()
+# HTTP/2 needs the optional 'h2' package
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
 
-async def fetch_neighborhoods(city_name: str) -> list:
+from src.config import settings, JSON_LINES
+
+console = Console(stderr=JSON_LINES)
+
+# District lists change rarely; cached results are reused for a week
+_CACHE_TTL_SECONDS = 86400 * 7
+
+# One pooled client per event loop (the CLI runs several asyncio.run() calls)
+_OVERPASS_CLIENTS: dict[int, httpx.AsyncClient] = {}
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the keep-alive Overpass client for the running event loop."""
+    loop_id = id(asyncio.get_running_loop())
+    client = _OVERPASS_CLIENTS.get(loop_id)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=30),
+            http2=_HTTP2,
+        )
+        _OVERPASS_CLIENTS[loop_id] = client
+    return client
+
+
+async def aclose_geo() -> None:
+    """Close the Overpass client bound to the running event loop."""
+    client = _OVERPASS_CLIENTS.pop(id(asyncio.get_running_loop()), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _cache_path(city_name: str) -> Path:
+    """On-disk cache file for a city's districts."""
+    digest = hashlib.md5(city_name.lower().encode()).hexdigest()
+    return Path(settings.OUTPUT_DIR) / ".geo_cache" / f"{digest}.json"
+
+
+async def fetch_neighborhoods(city_name: str, force_refresh: bool = False) -> list:
     """
     Fetch real neighborhoods for a city using OpenStreetMap's Overpass API.
+    
+    Results are cached on disk per city; pass force_refresh=True to bypass the cache.
     """
+    cache_path = _cache_path(city_name)
+    if not force_refresh:
+        try:
+            if time.time() - cache_path.stat().st_mtime < _CACHE_TTL_SECONDS:
+                neighborhoods = orjson.loads(cache_path.read_bytes())
+                console.print(f"[green]✅ Loaded {len(neighborhoods)} cached districts for {city_name}[/green]")
+                return neighborhoods
+        except (OSError, orjson.JSONDecodeError):
+            pass
+    
     console.print(f"[cyan]🌐 Fetching official districts for {city_name} from OpenStreetMap...[/cyan]")
     
     # Overpass API Query
-    # This looks for boundaries of type 'neighborhood' or 'suburb' within the area of the city name
+    # A single union covers neighborhood/suburb boundaries and the broader quarter/district places
     query = f"""
     [out:json][timeout:25];
     area[name="{city_name}"]->.searchArea;
     (
-      node["place"~"neighborhood|suburb"](area.searchArea);
-      way["place"~"neighborhood|suburb"](area.searchArea);
+      node["place"~"neighborhood|suburb|quarter|district"](area.searchArea);
+      way["place"~"neighborhood|suburb|quarter|district"](area.searchArea);
       relation["place"~"neighborhood|suburb"](area.searchArea);
     );
     out tags;
@@ -29,39 +89,26 @@ async def fetch_neighborhoods(city_name: str) -> list:
     url = "https://overpass-api.de/api/interpreter"
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(url, data={"data": query})
-            response.raise_for_status()
-            data = response.json()
-            
-            neighborhoods = []
-            for element in data.get("elements", []):
-                tags = element.get("tags", {})
-                name = tags.get("name")
-                if name and name not in neighborhoods:
-                    neighborhoods.append(name)
-            
-            # If we didn't find specific 'neighborhood' tags, try a broader search for 'quarter'
-            if not neighborhoods:
-                query_alt = f"""
-                [out:json][timeout:25];
-                area[name="{city_name}"]->.searchArea;
-                (
-                  node["place"~"quarter|district"](area.searchArea);
-                );
-                out tags;
-                """
-                response = await client.post(url, data={"data": query_alt})
-                data = response.json()
-                for element in data.get("elements", []):
-                    name = element.get("tags", {}).get("name")
-                    if name and name not in neighborhoods:
-                        neighborhoods.append(name)
-
-            # Clean and filter
-            neighborhoods = sorted(list(set(neighborhoods)))
-            console.print(f"[green]✅ Found {len(neighborhoods)} real districts![/green]")
-            return neighborhoods
+        client = _get_client()
+        response = await client.post(url, data={"data": query})
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        
+        seen: set[str] = set()
+        for element in data.get("elements", []):
+            name = element.get("tags", {}).get("name")
+            if name:
+                seen.add(name)
+        
+        neighborhoods = sorted(seen)
+        if neighborhoods:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                cache_path.write_bytes(orjson.dumps(neighborhoods))
+            except OSError:
+                pass
+        console.print(f"[green]✅ Found {len(neighborhoods)} real districts![/green]")
+        return neighborhoods
 
     except Exception as e:
         console.print(f"[yellow]⚠ Could not fetch districts from API: {e}[/yellow]")
@@ -71,5 +118,6 @@ if __name__ == "__main__":
     import asyncio
     async def test():
         n = await fetch_neighborhoods("Miami")
+        await aclose_geo()
         print(f"Miami neighborhoods: {n}")
     asyncio.run(test())
@@ -3,26 +3,61 @@ CLI interface for Google Maps Business Scraper.
 """
 
 import asyncio
+import atexit
+import logging
+import logging.handlers
+import mmap
+import queue
 import typer
 from typing import Optional
 from pathlib import Path
 import subprocess
 import sys
+from functools import lru_cache
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from src.config import JSON_LINES
+
+# Heavy imports (Playwright, scraper modules, rich widgets, uvloop) are deferred
+# to the commands that need them so `--help` and `version` start fast.
 app = typer.Typer(
     name="Google Maps Scraper",
     help="Scrape business data from Google Maps",
     add_completion=False
 )
-console = Console()
+console = Console(stderr=JSON_LINES)
+
+
+def _run(coro):
+    """Run a coroutine, preferring the libuv event loop when available."""
+    # uvloop does not support Windows; otherwise the default asyncio loop is used unchanged.
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+    return asyncio.run(coro)
+
+
+def _configure_logging() -> None:
+    """Route src.* log records through a queue so I/O happens on a background thread."""
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    logger = logging.getLogger("src")
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    listener.start()
+    atexit.register(listener.stop)
 
 
 def display_banner():
-    """Display application banner."""
+    """Display application banner (skipped when stdout is not a terminal)."""
+    if JSON_LINES:
+        return
     banner = """
 ╔═══════════════════════════════════════════════════════╗
 ║         🗺️  Google Maps Business Scraper  🗺️          ║
@@ -35,6 +70,10 @@ def display_banner():
 
 def display_summary(results: list, query: str, location: str):
     """Display a summary table of scraped results."""
+    from rich.table import Table
+
+    if JSON_LINES:
+        return
     if not results:
         console.print("[yellow]No results to display[/yellow]")
         return
@@ -60,16 +99,27 @@ def display_summary(results: list, query: str, location: str):
     console.print(table)
 
 
-async def run_scraper(query: str, location: str, limit: int, headless: bool, no_website: bool = False) -> list:
+def emit_json_line(record: dict):
+    """Write one JSON object per line to stdout for piped/redirected runs."""
+    import orjson
+
+    sys.stdout.write(orjson.dumps(record).decode("utf-8") + "\n")
+    sys.stdout.flush()
+
+
+async def run_scraper(
+    query: str,
+    location: str,
+    limit: int,
+    headless: bool,
+    no_website: bool = False,
+    detail: bool = True,
+) -> list:
     """Run the scraper asynchronously."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
     from src.browser import create_stealth_browser, close_browser
     from src.scraper import GoogleMapsScraper
-    from src.config import settings
 
-    # Override headless setting if specified
-    if headless:
-        settings.HEADLESS = True
-    
     browser = None
     try:
         with Progress(
@@ -78,10 +128,11 @@ async def run_scraper(query: str, location: str, limit: int, headless: bool, no_
             console=console
         ) as progress:
             progress.add_task(description="Starting browser...", total=None)
-            browser, context, page = await create_stealth_browser()
+            # --headless overrides the HEADLESS setting; otherwise fall back to config
+            browser, context, page = await create_stealth_browser(headless=headless or None)
         
         scraper = GoogleMapsScraper(browser, page)
-        results = await scraper.scrape_all(query, location, limit, no_website_only=no_website)
+        results = await scraper.scrape_all(query, location, limit, no_website_only=no_website, detail=detail)
         return results
         
     except Exception as e:
@@ -92,6 +143,149 @@ async def run_scraper(query: str, location: str, limit: int, headless: bool, no_
             await close_browser(browser)
 
 
+async def scrape_one(
+    page,
+    query: str,
+    location: str,
+    limit: int,
+    no_website: bool = False,
+    detail: bool = True,
+) -> list:
+    """Scrape a single query on an already prepared page."""
+    from src.scraper import GoogleMapsScraper
+
+    scraper = GoogleMapsScraper(page.context.browser, page)
+    return await scraper.scrape_all(query, location, limit, no_website_only=no_website, detail=detail)
+
+
+async def stream_one(
+    page,
+    query: str,
+    location: str,
+    limit: int,
+    sink,
+    no_website: bool = False,
+    detail: bool = True,
+) -> int:
+    """Scrape a single query, writing each lead to the sink as it arrives."""
+    from src.scraper import GoogleMapsScraper
+
+    scraper = GoogleMapsScraper(page.context.browser, page)
+    return await scraper.scrape_all_stream(query, location, limit, sink, no_website_only=no_website, detail=detail)
+
+
+async def bulk_async(
+    queries: list,
+    limit: int,
+    headless: bool,
+    output: str,
+    no_website: bool = False,
+    detail: bool = True,
+    manifest=None,
+) -> list:
+    """
+    Scrape and export all queries concurrently on one shared browser.
+    
+    Each query borrows a pooled context; MAX_CONCURRENCY bounds how many run at once.
+    CSV output is streamed to disk while scraping; other formats are exported when the query finishes.
+    Successful queries are recorded in the manifest (if given) as soon as they finish.
+    
+    Returns:
+        list: One (count, files) tuple per query, in input order
+    """
+    from src.browser import scoped_context, shutdown
+    from src.exporter import Exporter
+
+    async def _scrape(query: str, location: str) -> tuple:
+        count, files = await _scrape_and_export(query, location)
+        if count and manifest is not None:
+            manifest.put(manifest.key(query, location, limit, no_website, detail, output), count, files)
+        return count, files
+
+    async def _scrape_and_export(query: str, location: str) -> tuple:
+        try:
+            async with scoped_context(headless or None) as (context, page):
+                if output == "csv":
+                    with Exporter().open_csv_sink(query, location) as sink:
+                        count = await stream_one(page, query, location, limit, sink, no_website, detail)
+                    return count, {'csv': sink.filepath if count else None}
+                results = await scrape_one(page, query, location, limit, no_website, detail)
+        except Exception as e:
+            console.print(f"[red]Error scraping '{query}' in {location}: {e}[/red]")
+            return 0, {}
+        if not results:
+            return 0, {}
+        return len(results), await asyncio.to_thread(export_results, results, query, location, output)
+
+    try:
+        return await asyncio.gather(*(_scrape(q, loc) for q, loc in queries))
+    finally:
+        await shutdown()
+
+
+async def expand_async(
+    query: str,
+    location: str,
+    districts: list,
+    limit: int,
+    headless: bool,
+    no_website: bool = False,
+    detail: bool = True,
+) -> list:
+    """
+    Scrape a query district by district on one shared browser.
+    
+    Stops as soon as `limit` unique businesses (by name) have been collected.
+    """
+    from src.browser import scoped_context, shutdown
+
+    all_results = []
+    seen_names = set()
+    try:
+        for i, district in enumerate(districts, 1):
+            full_loc = f"{district}, {location}"
+            console.print(f"\n[bold magenta]📍 Area {i}/{len(districts)}: {district}[/bold magenta]")
+            
+            try:
+                async with scoped_context(headless or None) as (context, page):
+                    results = await scrape_one(page, query, full_loc, limit, no_website, detail)
+            except Exception as e:
+                console.print(f"[red]Error: {e}[/red]")
+                continue
+            
+            # Check results and deduplicate
+            for r in results:
+                if r['name'] not in seen_names:
+                    all_results.append(r)
+                    seen_names.add(r['name'])
+            
+            if len(all_results) >= limit:
+                break
+    finally:
+        await shutdown()
+    return all_results
+
+
+# Queries files above this size are read through mmap
+_MMAP_THRESHOLD = 10 * 1024 * 1024
+
+
+@lru_cache(maxsize=8)
+def _parse_queries_file(path: Path, mtime: float) -> tuple:
+    """Parse a `query|location` file; memoized per path and modification time."""
+    if path.stat().st_size > _MMAP_THRESHOLD:
+        # Very large files: scan lines from a memory map instead of one big str
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            lines = [line.decode('utf-8') for line in iter(mm.readline, b'')]
+    else:
+        lines = path.read_text(encoding='utf-8').splitlines()
+    return tuple(
+        (parts[0].strip(), parts[1].strip())
+        for line in lines if '|' in line
+        for parts in (line.split('|'),)
+    )
+
+
 def export_results(results: list, query: str, location: str, output_format: str) -> dict:
     """Export results to specified format."""
     from src.exporter import Exporter
@@ -119,8 +313,10 @@ def scrape(
     output: str = typer.Option("csv", "--output", "-o", help="Output format: csv/json/excel/all"),
     headless: bool = typer.Option(False, "--headless", "-h", help="Run browser in headless mode"),
     no_website: bool = typer.Option(False, "--no-website", help="Only include businesses without a website"),
+    detail: bool = typer.Option(True, "--detail/--no-detail", help="Open each listing for address/phone/website/hours (--no-detail reads the results list only)"),
     expand: bool = typer.Option(False, "--expand", "-e", help="Fetch real neighborhoods from OSM to maximize leads"),
-    crm_import: bool = typer.Option(True, "--crm-import/--no-crm-import", help="Auto-import CSV output into local CRM")
+    crm_import: bool = typer.Option(True, "--crm-import/--no-crm-import", help="Auto-import CSV output into local CRM"),
+    use_daemon: Optional[bool] = typer.Option(None, "--daemon/--no-daemon", help="Attach to a running `daemon` browser if one is up (default: USE_DAEMON, off)")
 ):
     """
     Scrape businesses from Google Maps.
@@ -128,52 +324,49 @@ def scrape(
     Example:
         python -m src.main scrape "restaurants" --location "Istanbul" --limit 20 --output csv
     """
+    from rich.panel import Panel
+
+    if use_daemon is not None:
+        from src.browser import set_daemon_enabled
+
+        set_daemon_enabled(use_daemon)
+
     display_banner()
     
-    console.print(Panel(
-        f"[cyan]Query:[/cyan] {query}\n"
-        f"[cyan]Location:[/cyan] {location}\n"
-        f"[cyan]Limit:[/cyan] {limit}\n"
-        f"[cyan]Output:[/cyan] {output}\n"
-        f"[cyan]Headless:[/cyan] {headless}\n"
-        f"[cyan]Filter No Website:[/cyan] {no_website}\n"
-        f"[cyan]Expand Search:[/cyan] {expand}",
-        title="🔍 Search Parameters"
-    ))
+    if not JSON_LINES:
+        console.print(Panel(
+            f"[cyan]Query:[/cyan] {query}\n"
+            f"[cyan]Location:[/cyan] {location}\n"
+            f"[cyan]Limit:[/cyan] {limit}\n"
+            f"[cyan]Output:[/cyan] {output}\n"
+            f"[cyan]Headless:[/cyan] {headless}\n"
+            f"[cyan]Filter No Website:[/cyan] {no_website}\n"
+            f"[cyan]Expand Search:[/cyan] {expand}",
+            title="🔍 Search Parameters"
+        ))
     
     if expand:
-        from src.geo import fetch_neighborhoods
+        from src.geo import fetch_neighborhoods, aclose_geo
+
+        async def _fetch_districts() -> list:
+            try:
+                return await fetch_neighborhoods(location)
+            finally:
+                await aclose_geo()
 
         # Fetch real districts from Overpass API
-        districts = asyncio.run(fetch_neighborhoods(location))
+        districts = _run(_fetch_districts())
         
         if districts:
             console.print(f"[green]📂 Successfully fetched {len(districts)} real districts![/green]")
-            all_results = []
-            seen_names = set()
-            
-            for i, district in enumerate(districts, 1):
-                full_loc = f"{district}, {location}"
-                console.print(f"\n[bold magenta]📍 Area {i}/{len(districts)}: {district}[/bold magenta]")
-                
-                # We divide the total limit by number of districts, or just keep going until hit limit
-                results = asyncio.run(run_scraper(query, full_loc, limit, headless, no_website))
-                
-                # Check results and deduplicate
-                for r in results:
-                    if r['name'] not in seen_names:
-                        all_results.append(r)
-                        seen_names.add(r['name'])
-                
-                if len(all_results) >= limit:
-                    break
-            results = all_results
+            # One browser for every district; each area borrows a pooled context
+            results = _run(expand_async(query, location, districts, limit, headless, no_website, detail))
         else:
             console.print("[yellow]⚠ No sub-districts found. Running standard search.[/yellow]")
-            results = asyncio.run(run_scraper(query, location, limit, headless, no_website))
+            results = _run(run_scraper(query, location, limit, headless, no_website, detail))
     else:
         # Run standard scraper
-        results = asyncio.run(run_scraper(query, location, limit, headless, no_website))
+        results = _run(run_scraper(query, location, limit, headless, no_website, detail))
     
     if results:
         # Display summary
@@ -195,14 +388,19 @@ def scrape(
                 console.print(f"[yellow]CRM import skipped: {e}[/yellow]")
         
         # Final summary
-        console.print(Panel(
-            f"[green]✅ Successfully scraped {len(results)} businesses![/green]\n\n"
-            f"[cyan]Files saved:[/cyan]\n" + 
-            "\n".join([f"  • {k}: {v}" for k, v in exported.items() if v]),
-            title="📋 Summary"
-        ))
+        if not JSON_LINES:
+            console.print(Panel(
+                f"[green]✅ Successfully scraped {len(results)} businesses![/green]\n\n"
+                f"[cyan]Files saved:[/cyan]\n" + 
+                "\n".join([f"  • {k}: {v}" for k, v in exported.items() if v]),
+                title="📋 Summary"
+            ))
+        else:
+            emit_json_line({'query': query, 'location': location, 'count': len(results), 'files': exported})
     else:
         console.print("[red]❌ No results found. Try a different query or location.[/red]")
+        if JSON_LINES:
+            emit_json_line({'query': query, 'location': location, 'count': 0, 'files': {}})
 
 
 @app.command()
@@ -212,7 +410,10 @@ def bulk(
     output: str = typer.Option("csv", "--output", "-o", help="Output format: csv/json/excel/all"),
     headless: bool = typer.Option(False, "--headless", "-h", help="Run browser in headless mode"),
     no_website: bool = typer.Option(False, "--no-website", help="Only include businesses without a website"),
-    crm_import: bool = typer.Option(True, "--crm-import/--no-crm-import", help="Auto-import CSV output into local CRM")
+    detail: bool = typer.Option(True, "--detail/--no-detail", help="Open each listing for address/phone/website/hours (--no-detail reads the results list only)"),
+    use_cache: bool = typer.Option(True, "--cache/--no-cache", help="Skip queries already scraped today with the same options"),
+    crm_import: bool = typer.Option(True, "--crm-import/--no-crm-import", help="Auto-import CSV output into local CRM"),
+    use_daemon: Optional[bool] = typer.Option(None, "--daemon/--no-daemon", help="Attach to a running `daemon` browser if one is up (default: USE_DAEMON, off)")
 ):
     """
     Run bulk scraping from a queries file.
@@ -225,6 +426,14 @@ def bulk(
     Example:
         python -m src.main bulk queries.txt --limit 20 --output excel
     """
+    from rich.panel import Panel
+    from rich.table import Table
+
+    if use_daemon is not None:
+        from src.browser import set_daemon_enabled
+
+        set_daemon_enabled(use_daemon)
+
     display_banner()
     
     # Read queries file
@@ -232,27 +441,21 @@ def bulk(
         console.print(f"[red]Error: File '{queries_file}' not found[/red]")
         raise typer.Exit(1)
     
-    queries = []
-    with open(queries_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line and '|' in line:
-                parts = line.split('|')
-                if len(parts) >= 2:
-                    queries.append((parts[0].strip(), parts[1].strip()))
+    queries = list(_parse_queries_file(queries_file.resolve(), queries_file.stat().st_mtime))
     
     if not queries:
         console.print("[red]Error: No valid queries found in file. Use format: query|location[/red]")
         raise typer.Exit(1)
     
-    console.print(Panel(
-        f"[cyan]Queries file:[/cyan] {queries_file}\n"
-        f"[cyan]Total queries:[/cyan] {len(queries)}\n"
-        f"[cyan]Limit per query:[/cyan] {limit}\n"
-        f"[cyan]Output format:[/cyan] {output}\n"
-        f"[cyan]Filter No Website:[/cyan] {no_website}",
-        title="📋 Bulk Scraping Parameters"
-    ))
+    if not JSON_LINES:
+        console.print(Panel(
+            f"[cyan]Queries file:[/cyan] {queries_file}\n"
+            f"[cyan]Total queries:[/cyan] {len(queries)}\n"
+            f"[cyan]Limit per query:[/cyan] {limit}\n"
+            f"[cyan]Output format:[/cyan] {output}\n"
+            f"[cyan]Filter No Website:[/cyan] {no_website}",
+            title="📋 Bulk Scraping Parameters"
+        ))
     
     # Show queries to process
     console.print("\n[cyan]Queries to process:[/cyan]")
@@ -260,18 +463,33 @@ def bulk(
         console.print(f"  {i}. {q} in {loc}")
     console.print()
     
-    # Process each query
+    # Queries already scraped today with the same options are served from the manifest
+    from src.cache import CacheManifest
+
+    manifest = CacheManifest()
+    cached = {}
+    if use_cache:
+        for query, location in queries:
+            entry = manifest.get(manifest.key(query, location, limit, no_website, detail, output))
+            if entry:
+                cached[(query, location)] = (entry['count'], entry['files'])
+        if cached:
+            console.print(f"[green]♻ {len(cached)} quer{'y' if len(cached) == 1 else 'ies'} served from cache (use --no-cache to re-scrape)[/green]")
+    to_scrape = [q for q in queries if q not in cached]
+    
+    # Scrape the rest concurrently; each result set is exported as soon as it is done
+    outcomes = {}
+    if to_scrape:
+        scraped = _run(bulk_async(to_scrape, limit, headless, output, no_website, detail, manifest))
+        outcomes = dict(zip(to_scrape, scraped))
     all_results = []
     
-    for i, (query, location) in enumerate(queries, 1):
-        console.print(f"\n[bold cyan]━━━ Processing {i}/{len(queries)}: {query} in {location} ━━━[/bold cyan]\n")
-        
-        results = asyncio.run(run_scraper(query, location, limit, headless, no_website))
-        
-        if results:
-            # Export results for this query
-            exported = export_results(results, query, location, output)
-            if crm_import:
+    for query, location in queries:
+        if (query, location) in cached:
+            count, exported = cached[(query, location)]
+        else:
+            count, exported = outcomes[(query, location)]
+            if count and crm_import:
                 try:
                     from src.crm_db import import_from_scraper_csv
 
@@ -280,22 +498,18 @@ def bulk(
                         import_from_scraper_csv(csv_path)
                 except Exception:
                     pass
-            all_results.append({
-                'query': query,
-                'location': location,
-                'count': len(results),
-                'files': exported
-            })
-            console.print(f"[green]✅ Scraped {len(results)} results for '{query}'[/green]")
-        else:
-            all_results.append({
-                'query': query,
-                'location': location,
-                'count': 0,
-                'files': {}
-            })
-            console.print(f"[yellow]⚠ No results for '{query}'[/yellow]")
+        all_results.append({
+            'query': query,
+            'location': location,
+            'count': count,
+            'files': exported
+        })
     
+    if JSON_LINES:
+        for r in all_results:
+            emit_json_line(r)
+        return
+
     # Final summary table
     console.print("\n")
     summary_table = Table(title="📊 Bulk Scraping Summary", show_lines=True)
@@ -331,6 +545,8 @@ def bulk(
 @app.command()
 def version():
     """Show version information."""
+    from rich.panel import Panel
+
     console.print(Panel(
         "[cyan]Google Maps Business Scraper[/cyan]\n"
         "[dim]Version: 1.0.0[/dim]\n\n"
@@ -342,11 +558,34 @@ def version():
     ))
 
 
+@app.command()
+def daemon(
+    port: Optional[int] = typer.Option(None, "--port", help="DevTools port (default: DAEMON_PORT, 9333)"),
+    headless: bool = typer.Option(True, "--headless/--headed", help="Run the daemon browser headless"),
+):
+    """
+    Keep a warm browser running so later scrape/bulk runs skip the Chromium launch.
+    
+    Example:
+        python -m src.main daemon
+    """
+    from src.browser import serve_daemon
+    from src.config import settings
+
+    console.print(f"[cyan]🔌 Browser daemon listening on localhost:{port or settings.DAEMON_PORT} (Ctrl+C to stop)[/cyan]")
+    try:
+        _run(serve_daemon(port, headless))
+    except KeyboardInterrupt:
+        console.print("[yellow]Daemon stopped[/yellow]")
+
+
 @app.command("crm")
 def crm(
     port: int = typer.Option(8501, "--port", help="Streamlit server port"),
 ):
     """Launch the local CRM frontend (Streamlit)."""
+    from rich.panel import Panel
+
     app_path = Path(__file__).parent.parent / "frontend" / "app.py"
     if not app_path.exists():
         console.print(f"[red]CRM app not found at {app_path}[/red]")
@@ -366,6 +605,7 @@ def crm_import_cmd(
     force: bool = typer.Option(False, "--force", help="Reimport CSVs even if previously imported"),
 ):
     """Import any new scraper CSVs from data/results into the CRM."""
+    from rich.panel import Panel
     from src.crm_db import import_new_results
 
     summary = import_new_results(force=force)
@@ -378,4 +618,5 @@ def crm_import_cmd(
 
 
 if __name__ == "__main__":
+    _configure_logging()
     app()
@@ -2,14 +2,324 @@
 Google Maps business scraping logic.
 """
 
+import asyncio
+import math
 import re
+import time
+from collections import OrderedDict
+from contextlib import contextmanager, suppress
+from types import SimpleNamespace
 from urllib.parse import quote_plus
 from playwright.async_api import Page, Browser, TimeoutError as PlaywrightTimeout
 from rich.console import Console
+from rich.errors import LiveError
+from rich.live import Live
+from rich.text import Text
 
-from src.browser import human_delay, random_scroll
+from src.browser import (
+    human_delay,
+    random_scroll,
+    acquire_context,
+    release_context,
+    acquire_listing_context,
+    release_listing_context,
+)
+from src.config import settings, JSON_LINES
 
-console = Console()
+console = Console(stderr=JSON_LINES)
+
+_RATING_RE = re.compile(r'(\d+[.,]\d+|\d+)')
+_REVIEWS_RE = re.compile(r'[\(]?(\d+)[\)]?')
+# Thousands separators dropped before reading a review count
+_SEPARATORS = str.maketrans('', '', ',.')
+
+# Scroll the results feed inside the page until it holds `target` listings, Google
+# shows the "end of the list" message, the count stalls or the tick budget runs out.
+# A MutationObserver reacts to new cards as soon as they are inserted (target/end
+# checks and the next scroll don't wait for the tick); the interval tick only
+# detects stalls. The scroll step doubles while results keep arriving and resets on a stall.
+_SCROLL_UNTIL_JS = """
+    ({target, minDelta, maxDelta, interval, stallTicks, maxTicks}) => new Promise(resolve => {
+        const feed = document.querySelector('div[role="feed"]');
+        const count = () => document.querySelectorAll('a[href*="/maps/place/"]').length;
+        if (!feed) return resolve({count: count(), reason: 'missing'});
+        const ended = () => (feed.textContent || '').includes("You've reached the end");
+
+        let delta = minDelta, last = -1, seen = -1, stalls = 0, ticks = 0, done = false;
+        let timer, observer;
+        const finish = (reason) => {
+            if (done) return;
+            done = true;
+            clearInterval(timer);
+            observer.disconnect();
+            resolve({count: count(), reason});
+        };
+        const scroll = () => {
+            feed.scrollTop += delta;
+            feed.querySelector('div[role="article"]:last-child')?.scrollIntoView({block: 'end'});
+            delta = Math.min(delta * 2, maxDelta);
+        };
+        // Returns the current count, or null once finished
+        const check = () => {
+            const n = count();
+            if (n >= target) finish('target');
+            else if (ended()) finish('end');
+            return done ? null : n;
+        };
+
+        observer = new MutationObserver(() => {
+            const n = check();
+            if (n !== null && n > seen) {
+                seen = n;
+                scroll();
+            }
+        });
+        observer.observe(feed, {childList: true, subtree: true});
+
+        const tick = () => {
+            const n = check();
+            if (n === null) return;
+            if (n === last) {
+                delta = minDelta;
+                if (++stalls >= stallTicks) return finish('stall');
+            } else stalls = 0;
+            if (ticks++ >= maxTicks) return finish('budget');
+            last = seen = Math.max(n, seen);
+            scroll();
+        };
+        timer = setInterval(tick, interval);
+        tick();
+    })
+"""
+
+# Deduped place hrefs in one round trip (a JS Set keeps first-seen order)
+_LISTING_URLS_JS = """
+    () => [...new Set(
+        Array.from(document.querySelectorAll('a[href*="/maps/place/"]'), a => a.href).filter(Boolean)
+    )]
+"""
+
+# Adaptive scroll step: doubles while results keep arriving, resets on a stall
+_SCROLL_DELTA_MIN = 3000
+_SCROLL_DELTA_MAX = 20000
+# In-page scroll tick (ms) and unchanged ticks that count as "no more results"
+_SCROLL_INTERVAL_MS = 400
+_SCROLL_STALL_TICKS = 8
+# Rough number of cards Maps appends per scroll, used to budget ticks
+_RESULTS_PER_SCROLL = 5
+
+# Every loaded result card in the feed. The card's detail lines read like
+# "Category · $$ · Street address"; the category is the first part of the first
+# such line and the address its last part (skipping price levels).
+_FEED_CARDS_JS = """
+    () => Array.from(document.querySelectorAll('div[role="feed"] div[role="article"]')).map(c => {
+        const lines = Array.from(c.querySelectorAll('.W4Efsd'))
+            .filter(el => !el.querySelector('.W4Efsd'))
+            .map(el => el.innerText.split(/[·⋅]/).map(t => t.trim()).filter(Boolean))
+            .filter(parts => parts.length && !/^\\d/.test(parts[0]));
+        const info = lines[0] || [];
+        const last = info.length > 1 ? info[info.length - 1] : null;
+        return {
+            name: c.querySelector('.qBF1Pd')?.innerText?.trim() || c.getAttribute('aria-label'),
+            rating: c.querySelector('span.MW4etd')?.innerText ?? null,
+            reviews_count: c.querySelector('span.UY7F9')?.innerText ?? null,
+            category: info[0] || c.querySelector('.W4Efsd span')?.innerText?.trim() || null,
+            address: last && !/^[$€£₺¥]+$/.test(last) ? last : null,
+            url: c.querySelector('a[href*="/maps/place/"]')?.href ?? null,
+            has_website: !!c.querySelector('a[aria-label*="Website"], button[aria-label*="Website"]')
+        };
+    })
+"""
+
+# Map each place URL to whether its sidebar card shows a Website button
+_WEBSITE_FLAGS_JS = """
+    (urls) => Object.fromEntries(urls.map(u => {
+        const slug = u.split('/place/')[1]?.split('/')[0];
+        const card = slug ? document.querySelector(`a[href*="${slug}"]`)?.closest('div[role="article"]') : null;
+        return [u, !!card?.querySelector('a[aria-label*="Website"], button[aria-label*="Website"]')];
+    }))
+"""
+
+# Fallback selectors per listing field, highest priority first. Kept as ordered
+# tuples: a CSS selector list (`a, b` or `:is(a, b)`) returns the first match in
+# document order, not the first selector that matches.
+NAME_SEL = ('h1.DUwDvf', 'h1.fontHeadlineLarge', 'h1')
+RATING_SEL = ('div.F7nice span:first-child', 'span.ceNzKf', 'div.fontDisplayLarge', 'span.fontDisplayLarge', 'span.MW4etd')
+REVIEWS_SEL = ('div.F7nice span:last-child', 'span.UY7F9', 'button[jsaction*="reviews"]')
+CATEGORY_SEL = ('button[jsaction*="category"]', 'span.DkEaL')
+ADDRESS_SEL = ('button[data-item-id="address"]', 'div.rogA2c div.fontBodyMedium')
+PHONE_SEL = ('button[data-item-id*="phone:tel"]', 'a[href^="tel:"]')
+
+_LISTING_SELECTORS = {
+    'name': NAME_SEL,
+    'rating': RATING_SEL,
+    'reviews': REVIEWS_SEL,
+    'category': CATEGORY_SEL,
+    'address': ADDRESS_SEL,
+    'phone': PHONE_SEL,
+}
+
+# Any one of these means the contact section has rendered (order doesn't matter here)
+_DETAIL_READY_SEL = 'button[data-item-id*="phone"], a[data-item-id*="authority"], button[data-item-id="address"]'
+
+# Read and normalize every listing field in one round trip. Selector lists are tried
+# in order; numbers are parsed and multi-line text flattened in the page.
+_EXTRACT_LISTING_JS = r"""
+    (sel) => {
+        const first = (sel) => Array.isArray(sel)
+            ? sel.reduce((acc, s) => acc || document.querySelector(s), null)
+            : document.querySelector(sel);
+
+        const getTxt = (sel) => {
+            const el = first(sel);
+            return el ? el.innerText.trim() : null;
+        };
+
+        const getAttr = (sel, attr) => {
+            const el = document.querySelector(sel);
+            return el ? el.getAttribute(attr) : null;
+        };
+
+        const toRating = (t) => {
+            const m = t && t.match(/(\d+[.,]\d+|\d+)/);
+            return m ? parseFloat(m[1].replace(',', '.')) : null;
+        };
+
+        const toCount = (t) => {
+            const m = t && t.replace(/[.,]/g, '').match(/(\d+)/);
+            return m ? parseInt(m[1], 10) : null;
+        };
+
+        const address = getTxt(sel.address);
+        // tel: links carry the dialable number in href; buttons only in their text
+        const phoneEl = first(sel.phone);
+        const phone = phoneEl
+            ? (phoneEl.matches('a[href^="tel:"]') ? phoneEl.getAttribute('href').slice(4) : phoneEl.innerText.trim())
+            : null;
+        // aria-labels start with Open/Closed and read fine as-is; innerText needs flattening
+        const hours = getAttr('div[aria-label*="hours"]', 'aria-label') || getTxt('div.t39EBf');
+
+        return {
+            name: getTxt(sel.name),
+            rating: toRating(getTxt(sel.rating)),
+            reviews_count: toCount(getTxt(sel.reviews)),
+            category: getTxt(sel.category),
+            address: address ? address.replace(/\n/g, ', ') : null,
+            phone: phone ? phone.replace(/\n/g, ' ') : null,
+            website: getAttr('a[data-item-id="authority"]', 'href') || getAttr('a[aria-label*="Website"]', 'href'),
+            hours: hours && !/^(Open|Closed)/.test(hours) ? hours.replace(/\n/g, ', ') : hours
+        };
+    }
+"""
+
+# Place id in a listing URL (`!1s0x...:0x...`); stable across the coordinates in the path
+_PLACE_ID_RE = re.compile(r'!1s(0x[0-9a-f]+:0x[0-9a-f]+)', re.I)
+_PLACE_PATH_RE = re.compile(r'/maps/place/([^/?]+)')
+
+# Process-level listing cache: key -> (expires_at, record), oldest first
+_LISTING_CACHE: OrderedDict = OrderedDict()
+_LISTING_CACHE_MAX = 5000
+
+
+def _listing_key(url: str) -> str:
+    """Cache key of a listing URL: its place id, or the /maps/place/<name> segment."""
+    m = _PLACE_ID_RE.search(url) or _PLACE_PATH_RE.search(url)
+    return m.group(1) if m else url
+
+
+def _cached_listing(url: str) -> dict | None:
+    """Return a copy of a fresh cached record for this listing, if any."""
+    key = _listing_key(url)
+    hit = _LISTING_CACHE.get(key)
+    if hit is None:
+        return None
+    if hit[0] < time.monotonic():
+        del _LISTING_CACHE[key]
+        return None
+    _LISTING_CACHE.move_to_end(key)
+    return dict(hit[1])
+
+
+def _cache_listing(url: str, data: dict) -> None:
+    """Remember a successfully scraped listing for LISTING_CACHE_TTL seconds."""
+    if settings.LISTING_CACHE_TTL <= 0:
+        return
+    key = _listing_key(url)
+    _LISTING_CACHE[key] = (time.monotonic() + settings.LISTING_CACHE_TTL, dict(data))
+    _LISTING_CACHE.move_to_end(key)
+    if len(_LISTING_CACHE) > _LISTING_CACHE_MAX:
+        _LISTING_CACHE.popitem(last=False)
+
+
+# Upper bound (seconds) of the failure backoff between listing scrapes
+_MAX_BACKOFF = 30
+
+# Listings scraped on one pooled context before it is replaced with a fresh one
+_CONTEXT_MAX_USES = 50
+
+# Fields of a lead record, in export column order
+LEAD_FIELDS = (
+    'name', 'rating', 'reviews_count', 'category',
+    'address', 'phone', 'website', 'hours', 'google_maps_url',
+)
+
+
+def _parse_numbers(data: dict) -> None:
+    """Convert the raw rating/reviews_count text of a record to numbers in place."""
+    if data.get('rating'):
+        m = _RATING_RE.search(data['rating'])
+        data['rating'] = float(m.group(1).replace(',', '.')) if m else None
+    
+    if data.get('reviews_count'):
+        m = _REVIEWS_RE.search(data['reviews_count'].translate(_SEPARATORS))
+        data['reviews_count'] = int(m.group(1)) if m else None
+
+
+# Listing pages only read text from the DOM
+_LISTING_BLOCKED_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+# Telemetry and photo/tile hosts, whatever resource type they are requested as
+_LISTING_BLOCKED_HOSTS_RE = re.compile(
+    r"googletagmanager\.com|doubleclick\.net|google-analytics\.com|googleusercontent\.com"
+)
+
+
+async def _block_heavy_resources(route) -> None:
+    """Abort non-essential resource types and telemetry on listing pages."""
+    request = route.request
+    if request.resource_type in _LISTING_BLOCKED_TYPES or _LISTING_BLOCKED_HOSTS_RE.search(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+@contextmanager
+def _live_status():
+    """Single-line Live region; yields None if another Live display owns the console."""
+    live = Live(Text(), console=console, refresh_per_second=4, transient=True)
+    try:
+        live.start()
+    except LiveError:
+        # Concurrent scrapes (bulk mode) share the console; only one may show progress
+        yield None
+        return
+    try:
+        yield live
+    finally:
+        live.stop()
+
+
+# Marks the end of a stream_all queue
+_STREAM_DONE = object()
+
+
+class _QueueSink:
+    """Sink that hands rows to an asyncio.Queue (backs stream_all)."""
+    
+    def __init__(self):
+        self.queue: asyncio.Queue = asyncio.Queue()
+    
+    def write(self, row: dict) -> None:
+        self.queue.put_nowait(row)
 
 
 class GoogleMapsScraper:
@@ -26,6 +336,88 @@ class GoogleMapsScraper:
         self.browser = browser
         self.page = page
         self.base_url = "https://www.google.com/maps/search/"
+        # Listing contexts as [context, page, uses], filled by start()
+        self._context_pool: asyncio.Queue | None = None
+        # Listing outcomes that drive the delay between scrapes (see _pace)
+        self._consecutive_ok = 0
+        self._failures = 0
+    
+    async def _pace(self, ok: bool) -> None:
+        """
+        Sleep between listing scrapes, adapting to how Google is responding.
+        
+        After a run of successes the delay shrinks to near zero; each failure
+        resets the run and backs off exponentially (capped at _MAX_BACKOFF seconds).
+        """
+        if ok:
+            self._consecutive_ok += 1
+            self._failures = 0
+            if self._consecutive_ok > 5:
+                await human_delay(0, 0.1)
+            else:
+                await human_delay(0.1, 0.3)
+        else:
+            self._consecutive_ok = 0
+            self._failures += 1
+            await asyncio.sleep(min(2 ** self._failures, _MAX_BACKOFF))
+    
+    @staticmethod
+    async def _prepare_listing_context(context, page) -> list:
+        """Install listing request blocking and wrap the pair as a pool entry."""
+        # Context-level route covers every page the context opens
+        await context.route("**/*", _block_heavy_resources)
+        return [context, page, 0]
+    
+    async def start(self, limit: int = None) -> None:
+        """
+        Fill the listing context pool; no-op if already started.
+        
+        Holds at most min(LISTING_CONCURRENCY, limit) contexts. Slots are shared by
+        every scrape on the browser: the first is waited for, further ones are only
+        taken while free, so concurrent scrapes can't deadlock on each other.
+        """
+        if self._context_pool is not None:
+            return
+        size = max(1, min(settings.LISTING_CONCURRENCY, limit or settings.LISTING_CONCURRENCY))
+        pool = asyncio.Queue()
+        try:
+            while pool.qsize() < size:
+                pair = await acquire_listing_context(wait=pool.empty())
+                if pair is None:
+                    break
+                try:
+                    pool.put_nowait(await self._prepare_listing_context(*pair))
+                except BaseException:
+                    await release_listing_context(pair[0])
+                    raise
+        except BaseException:
+            while not pool.empty():
+                await release_listing_context(pool.get_nowait()[0])
+            raise
+        self._context_pool = pool
+    
+    async def close(self) -> None:
+        """Release every pooled listing context (and its slot); the browser stays open."""
+        pool, self._context_pool = self._context_pool, None
+        while pool is not None and not pool.empty():
+            await release_listing_context(pool.get_nowait()[0])
+    
+    async def _recycled(self, entry: list) -> list:
+        """
+        Return the pool entry to scrape the next listing on.
+        
+        Contexts are reused across listings (warm cookies and cache) and
+        replaced after _CONTEXT_MAX_USES listings to keep memory bounded.
+        The replacement keeps the worn context's slot.
+        """
+        if entry[2] < _CONTEXT_MAX_USES:
+            return entry
+        await release_context(entry[0])
+        try:
+            return await self._prepare_listing_context(*await acquire_context())
+        except Exception as e:
+            console.print(f"[red]✗ Could not recycle listing context: {e}[/red]")
+            raise
     
     async def search(self, query: str, location: str) -> bool:
         """
@@ -84,58 +476,36 @@ class GoogleMapsScraper:
                 console.print("[red]✗ Results container not found[/red]")
                 return 0
             
-            previous_count = 0
-            no_change_count = 0
+            # Hard cap on ticks; the slack covers slow loads while the feed is still growing
+            max_ticks = math.ceil(max_results / _RESULTS_PER_SCROLL) * 2 + _SCROLL_STALL_TICKS
             
-            while True:
-                # Get current listing count
-                listings = await self.page.query_selector_all('a[href*="/maps/place/"]')
-                current_count = len(listings)
-                
-                console.print(f"[yellow]Loading... {current_count} businesses found[/yellow]", end="\r")
-                
-                # Check if we have enough results
-                if current_count >= max_results:
-                    console.print(f"\n[green]✓ Reached target: {current_count} businesses[/green]")
-                    break
-                
-                # Check for "end of results" message
-                end_message = await self.page.query_selector('span:has-text("You\'ve reached the end")')
-                if end_message:
-                    console.print(f"\n[green]✓ End of results: {current_count} businesses[/green]")
-                    break
-                
-                # Check if no new results are loading
-                if current_count == previous_count:
-                    no_change_count += 1
-                    if no_change_count >= 3:
-                        console.print(f"\n[yellow]⚠ No more results loading: {current_count} businesses[/yellow]")
-                        break
-                else:
-                    no_change_count = 0
-                
-                previous_count = current_count
-                
-                # More aggressive scroll to force Google to load more
-                await self.page.evaluate('''
-                    const feed = document.querySelector('div[role="feed"]');
-                    if (feed) {
-                        feed.scrollTop += 5000;
-                    }
-                ''')
-                
-                # Small hover over the list to trigger active loading
-                try:
-                    await self.page.hover('div[role="feed"] div[role="article"]:last-child')
-                except:
-                    pass
-                    
-                await human_delay(0.6, 1.2)
+            # The whole scroll loop runs in the page: one round trip, no per-step sleeps
+            with _live_status() as live:
+                if live is not None:
+                    live.update(Text("Loading businesses...", style="yellow"))
+                state = await self.page.evaluate(_SCROLL_UNTIL_JS, {
+                    'target': max_results,
+                    'minDelta': _SCROLL_DELTA_MIN,
+                    'maxDelta': _SCROLL_DELTA_MAX,
+                    'interval': _SCROLL_INTERVAL_MS,
+                    'stallTicks': _SCROLL_STALL_TICKS,
+                    'maxTicks': max_ticks,
+                })
+            
+            current_count = state['count']
+            if state['reason'] == 'target':
+                console.print(f"[green]✓ Reached target: {current_count} businesses[/green]")
+            elif state['reason'] == 'end':
+                console.print(f"[green]✓ End of results: {current_count} businesses[/green]")
+            elif state['reason'] == 'budget':
+                console.print(f"[yellow]⚠ Scroll budget reached: {current_count} businesses[/yellow]")
+            else:
+                console.print(f"[yellow]⚠ No more results loading: {current_count} businesses[/yellow]")
             
             return current_count
             
         except Exception as e:
-            console.print(f"\n[red]✗ Scroll error: {e}[/red]")
+            console.print(f"[red]✗ Scroll error: {e}[/red]")
             return 0
     
     async def get_listing_urls(self) -> list:
@@ -146,13 +516,7 @@ class GoogleMapsScraper:
             list: List of unique business URLs
         """
         try:
-            links = await self.page.query_selector_all('a[href*="/maps/place/"]')
-            
-            urls = []
-            for link in links:
-                href = await link.get_attribute('href')
-                if href and href not in urls:
-                    urls.append(href)
+            urls = await self.page.evaluate(_LISTING_URLS_JS)
             
             console.print(f"[green]✓ Found {len(urls)} unique business URLs[/green]")
             return urls
@@ -161,84 +525,167 @@ class GoogleMapsScraper:
             console.print(f"[red]✗ Error extracting URLs: {e}[/red]")
             return []
     
-    async def scrape_listing(self, url: str) -> dict:
-        """Scrape a single listing efficiently using unified JS extraction."""
+    async def scrape_listing(self, url: str, page: Page | None = None) -> dict:
+        """
+        Scrape a single listing efficiently using unified JS extraction.
+        
+        Args:
+            url: Google Maps place URL
+            page: Page to navigate (defaults to self.page); concurrent callers pass their own
+        """
+        # Overlapping queries keep returning the same venues; reuse this run's scrape
+        cached = _cached_listing(url)
+        if cached is not None:
+            return cached
+        
+        page = page or self.page
+        key = _listing_key(url)
         try:
-            await self.page.goto(url, wait_until='domcontentloaded', timeout=20000)
-            await self.page.wait_for_selector('h1', timeout=7000)
-            
-            # Unified extraction (Single IPC call for maximum speed)
-            data = await self.page.evaluate("""
-                () => {
-                    const getTxt = (sel) => {
-                        const el = Array.isArray(sel) 
-                            ? sel.reduce((acc, s) => acc || document.querySelector(s), null)
-                            : document.querySelector(sel);
-                        return el ? el.innerText.trim() : null;
-                    };
-
-                    const getAttr = (sel, attr) => {
-                        const el = document.querySelector(sel);
-                        return el ? el.getAttribute(attr) : null;
-                    };
-
-                    return {
-                        name: getTxt(['h1.DUwDvf', 'h1.fontHeadlineLarge', 'h1']),
-                        rating: getTxt(['div.F7nice span:first-child', 'span.ceNzKf', 'span.MW4etd']),
-                        reviews_count: getTxt(['div.F7nice span:last-child', 'span.UY7F9', 'button[jsaction*="reviews"]']),
-                        category: getTxt(['button[jsaction*="category"]', 'span.DkEaL']),
-                        address: getTxt(['button[data-item-id="address"]', 'div.rogA2c div.fontBodyMedium']),
-                        phone: getTxt(['button[data-item-id*="phone:tel"]', 'a[href^="tel:"]']),
-                        website: getAttr('a[data-item-id="authority"]', 'href') || getAttr('a[aria-label*="Website"]', 'href'),
-                        hours: getAttr('div[aria-label*="hours"]', 'aria-label') || getTxt('div.t39EBf')
-                    };
-                }
-            """)
-            
-            # Post-process numeric values
-            if data['rating']:
-                m = re.search(r'(\d+[.,]\d+|\d+)', data['rating'])
-                data['rating'] = float(m.group(1).replace(',', '.')) if m else None
-            
-            if data['reviews_count']:
-                m = re.search(r'(\d+)', data['reviews_count'].replace(',', '').replace('.', ''))
-                data['reviews_count'] = int(m.group(1)) if m else None
+            # Don't wait on the navigation itself; the h1 is the real readiness gate
+            try:
+                await page.goto(url, wait_until='commit', timeout=5000)
+            except PlaywrightTimeout:
+                # Pooled pages are reused: until the new document commits, the previous
+                # listing (and its h1) is still attached. Only go on once we've moved.
+                await page.wait_for_url(lambda u: _listing_key(u) == key, wait_until='commit', timeout=8000)
+            await page.wait_for_selector('h1', state='attached', timeout=8000)
+            # Contact rows usually render right after the h1; give them a brief chance,
+            # but listings without any of them shouldn't wait out a long timeout
+            try:
+                await page.wait_for_selector(_DETAIL_READY_SEL, state='attached', timeout=500)
+            except PlaywrightTimeout:
+                pass
             
-            # Post-process address, phone, hours for formatting if they exist
-            if data['address']:
-                data['address'] = data['address'].replace('\n', ', ')
-            if data['phone']:
-                data['phone'] = data['phone'].replace('\n', ' ')
-                # If phone was extracted from an href, it might still be 'tel:...'
-                if data['phone'].startswith('tel:'):
-                    data['phone'] = data['phone'].replace('tel:', '')
-            if data['hours']:
-                # If hours came from innerText, it might have newlines
-                if not data['hours'].startswith('Open') and not data['hours'].startswith('Closed'): # Heuristic to check if it's an aria-label or innerText
-                    data['hours'] = data['hours'].replace('\n', ', ')
+            # Unified extraction and cleanup (single IPC call for maximum speed)
+            data = await page.evaluate(_EXTRACT_LISTING_JS, _LISTING_SELECTORS)
             
-            data['google_maps_url'] = self.page.url
+            data['google_maps_url'] = page.url
+            # Never file a record under a place id other than the one it was read from
+            if data['name'] and _listing_key(page.url) == key:
+                _cache_listing(url, data)
             return data
             
         except Exception as e:
             console.print(f"[red]✗ Error scraping listing: {e}[/red]")
-            return {
-                'name': None,
-                'rating': None,
-                'reviews_count': None,
-                'category': None,
-                'address': None,
-                'phone': None,
-                'website': None,
-                'hours': None,
-                'google_maps_url': url
-            }
+            return {**dict.fromkeys(LEAD_FIELDS), 'google_maps_url': url}
     
-    async def scrape_all(self, query: str, location: str, limit: int = 50, no_website_only: bool = False) -> list:
+    async def extract_sidebar_bulk(self) -> list:
+        """
+        Extract every loaded result card from the sidebar feed in one evaluate call.
+        
+        Cards carry name, rating, review count, category and usually a short
+        address; phone, website and hours are left as None (they need the listing page).
+        
+        Returns:
+            list: Lead records, plus a transient 'has_website' flag per record
+        """
+        try:
+            cards = await self.page.evaluate(_FEED_CARDS_JS)
+        except Exception as e:
+            console.print(f"[red]✗ Error reading sidebar: {e}[/red]")
+            return []
+        
+        records = []
+        for card in cards:
+            if not card['url']:
+                continue
+            data = dict.fromkeys(LEAD_FIELDS)
+            data.update(
+                name=card['name'],
+                rating=card['rating'],
+                reviews_count=card['reviews_count'],
+                category=card['category'],
+                address=card['address'],
+                google_maps_url=card['url'],
+                has_website=card['has_website'],
+            )
+            _parse_numbers(data)
+            records.append(data)
+        return records
+    
+    async def scrape_all(
+        self,
+        query: str,
+        location: str,
+        limit: int = 50,
+        no_website_only: bool = False,
+        detail: bool = True,
+    ) -> list:
         """
         Scrape all businesses matching the search criteria iteratively.
+        
+        With detail=False, records come straight from the sidebar feed (see
+        scrape_feed_only); phone, website and hours stay empty.
+        """
+        if not detail:
+            return await self.scrape_feed_only(query, location, limit, no_website_only)
+        return [row async for row in self.stream_all(query, location, limit, no_website_only, detail)]
+    
+    async def scrape_feed_only(
+        self,
+        query: str,
+        location: str,
+        limit: int = 50,
+        no_website_only: bool = False,
+    ) -> list:
+        """
+        Search and read leads from the results feed only, without opening any listing.
+        
+        Records carry name, rating, reviews count, category and the card's short
+        address; phone, website and hours stay None.
+        """
+        rows = []
+        if not await self.search(query, location):
+            return rows
+        await self._scrape_sidebar(limit, SimpleNamespace(write=rows.append), no_website_only)
+        return rows
+    
+    async def stream_all(
+        self,
+        query: str,
+        location: str,
+        limit: int = 50,
+        no_website_only: bool = False,
+        detail: bool = True,
+    ):
+        """
+        Async generator over scrape_all's leads, yielding each one as soon as it is scraped.
+        
+        Scraping keeps running while the caller consumes rows; leaving the loop
+        early cancels it.
+        """
+        sink = _QueueSink()
+        task = asyncio.create_task(
+            self.scrape_all_stream(query, location, limit, sink, no_website_only, detail)
+        )
+        task.add_done_callback(lambda _: sink.queue.put_nowait(_STREAM_DONE))
+        try:
+            while (row := await sink.queue.get()) is not _STREAM_DONE:
+                yield row
+            # Re-raise anything the scrape task failed with
+            await task
+        finally:
+            if not task.done():
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+    
+    async def scrape_all_stream(
+        self,
+        query: str,
+        location: str,
+        limit: int,
+        sink,
+        no_website_only: bool = False,
+        detail: bool = True,
+    ) -> int:
         """
-        results = []
+        Scrape like scrape_all, but hand each lead to sink.write(row) as soon as it is ready.
+        
+        Returns:
+            int: Number of leads written
+        """
+        written = 0
         processed_urls = set()
         
         search_term = f"{query} in {location}"
@@ -247,16 +694,60 @@ class GoogleMapsScraper:
         
         # Initial Search
         if not await self.search(query, location):
-            return results
+            return written
+        
+        if not detail:
+            return await self._scrape_sidebar(limit, sink, no_website_only)
         
-        # 1. Prepare Background Listing Page (Optimization: No more search reloads!)
-        listing_page = await self.page.context.new_page()
+        # 1. Prepare the listing context pool; parallel workers never share cookies
+        #    or session state with each other or the search page
+        await self.start(limit)
         
         console.print(f"\n[cyan]📋 Starting High-Speed Scrape... (Target: {limit} leads)[/cyan]")
         
+        pending: asyncio.Queue = asyncio.Queue()
+        
+        async def worker(pool: asyncio.Queue) -> None:
+            # Each worker holds one pooled context/page and navigates it listing after listing
+            entry = await pool.get()
+            try:
+                while written < limit:
+                    try:
+                        url = pending.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    # Cache hits make no request: no pacing, no wear on the context
+                    data = _cached_listing(url)
+                    if data is None:
+                        entry = await self._recycled(entry)
+                        data = await self.scrape_listing(url, entry[1])
+                        entry[2] += 1
+                        await self._pace(bool(data.get("name")))
+                    accept(url, data)
+            finally:
+                pool.put_nowait(entry)
+        
+        def accept(url: str, data: dict) -> None:
+            nonlocal written
+            if data.get("name"):
+                if no_website_only and data.get("website"):
+                    console.print(f"[yellow]⏭ Skipped {data['name']} (Has website)[/yellow]")
+                    return
+                if written >= limit:
+                    return
+                # Single-threaded event loop: the counter needs no lock
+                sink.write(data)
+                written += 1
+                # Progress line every 10 leads keeps console writes off the hot path
+                if written % 10 == 0 or written == limit:
+                    rating = data.get("rating", "N/A")
+                    console.print(f"[cyan]▶ [{written}/{limit} leads][/cyan] [bold green]✅ {data['name']} ({rating}⭐)[/bold green]")
+            else:
+                console.print(f"[red]⚠ Failed: {url}[/red]")
+        
         total_attempts = 0
         try:
-            while len(results) < limit:
+            while written < limit:
                 # 1. Scroll Results
                 await self.scroll_results(limit * 3)
                 
@@ -268,57 +759,68 @@ class GoogleMapsScraper:
                     console.print("[red]❌ Exhausted all possible results.[/red]")
                     break
                 
-                # 3. Process Batch
+                # --- SIDEBAR RADAR (Optimization for No-Website Filter) ---
+                # If user only wants leads without websites, check every sidebar card in one call before clicking
+                has_website = {}
+                if no_website_only:
+                    has_website = await self.page.evaluate(_WEBSITE_FLAGS_JS, new_urls)
+                
+                # 3. Pick this round's batch (no more than the leads still missing)
+                batch = []
                 for url in new_urls:
-                    if len(results) >= limit:
+                    if len(batch) >= limit - written:
                         break
                     
                     processed_urls.add(url)
                     total_attempts += 1
                     
-                    # --- SIDEBAR RADAR (Optimization for No-Website Filter) ---
-                    # If user only wants leads without websites, we check the sidebar button before clicking
-                    if no_website_only:
-                        has_website_indicator = await self.page.evaluate(f"""
-                            (targetUrl) => {{
-                                const slug = targetUrl.split('/place/')[1]?.split('/')[0];
-                                const container = document.querySelector(`a[href*="${{slug}}"]`)?.closest('div[role="article"]');
-                                if (!container) return false;
-                                return !!(container.querySelector('a[aria-label*="Website"]') || 
-                                         container.querySelector('button[aria-label*="Website"]'));
-                            }}
-                        """, url)
-                        
-                        if has_website_indicator:
-                            continue # Skip without opening second tab!
-
-                    # 4. Deep scrape using the SECOND TAB
-                    console.print(f"[cyan]▶ [{len(results)}/{limit} leads][/cyan] Scoping: ", end="")
-                    
-                    original_page = self.page
-                    self.page = listing_page
-                    try:
-                        data = await self.scrape_listing(url)
-                    finally:
-                        self.page = original_page
+                    if has_website.get(url):
+                        continue # Skip without opening a listing page!
                     
-                    if data.get("name"):
-                        if no_website_only and data.get("website"):
-                            console.print(f"[yellow]⏭ Skipped {data['name']} (Has website)[/yellow]")
-                            continue
-                        
-                        rating = data.get("rating", "N/A")
-                        console.print(f"[bold green]✅ {data['name']} ({rating}⭐)[/bold green]")
-                        results.append(data)
-                    else:
-                        console.print(f"[red]⚠ Failed[/red]")
-                        
-                    await human_delay(0.1, 0.3)
+                    batch.append(url)
+                
+                # 4. Deep scrape the batch: workers drain the URL queue concurrently
+                for url in batch:
+                    pending.put_nowait(url)
+                pool = self._context_pool
+                workers = [asyncio.create_task(worker(pool)) for _ in range(min(len(batch), pool.qsize()))]
+                try:
+                    await asyncio.gather(*workers)
+                except BaseException:
+                    # One worker failed (or we were cancelled): stop the rest and let them
+                    # return their contexts before close() releases the pool
+                    for task in workers:
+                        task.cancel()
+                    await asyncio.gather(*workers, return_exceptions=True)
+                    raise
         finally:
-            await listing_page.close()
+            await self.close()
 
-        console.print(f"\n[bold green]🏁 Scrape Complete! Found {len(results)} leads total.[/bold green]")
-        return results
+        console.print(f"\n[bold green]🏁 Scrape Complete! Found {written} leads total.[/bold green]")
+        return written
+    
+    async def _scrape_sidebar(self, limit: int, sink, no_website_only: bool = False) -> int:
+        """Write up to `limit` sidebar-only records from the current search to the sink."""
+        written = 0
+        seen_urls = set()
+        while written < limit:
+            await self.scroll_results(limit * 3)
+            fresh = [r for r in await self.extract_sidebar_bulk() if r['google_maps_url'] not in seen_urls]
+            if not fresh:
+                console.print("[red]❌ Exhausted all possible results.[/red]")
+                break
+            for record in fresh:
+                seen_urls.add(record['google_maps_url'])
+                has_website = record.pop('has_website')
+                if not record['name'] or (no_website_only and has_website):
+                    continue
+                sink.write(record)
+                written += 1
+                if written >= limit:
+                    break
+        
+        console.print(f"\n[bold green]🏁 Scrape Complete! Found {written} leads total.[/bold green]")
+        return written
 
 
 if __name__ == "__main__":